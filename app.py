@@ -1,11 +1,10 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from wordcloud import WordCloud
 import numpy as np
+import pyarrow as pa
 
 # Page configuration
 st.set_page_config(
@@ -15,6 +14,27 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Height shared by every chart
+CHART_HEIGHT = 400
+
+# Switch scatter traces to WebGL above this many points
+WEBGL_MIN_POINTS = 1000
+
+# Histogram bins 0.25 wide, centred on each 0.25 step of the 0-5 rating scale
+RATING_BINS = np.arange(-0.125, 5.25, 0.25)
+
+# Plotly config for charts nobody hovers or zooms (pie, count bars)
+STATIC_CHART_CONFIG = {"staticPlot": True}
+
+# Rows sent to the detailed dataset table by default
+PREVIEW_ROWS = 200
+
+# Filter states kept by caches holding large results (frames, images, CSV bytes)
+LARGE_CACHE_ENTRIES = 32
+
+# Filter states kept by caches holding small per-subject/per-bin aggregations
+SMALL_CACHE_ENTRIES = 256
+
 # Custom styling
 st.markdown("""
     <style>
@@ -31,14 +51,105 @@ st.markdown("---")
 # Load data with caching
 @st.cache_data
 def load_data():
-    return pd.read_csv("course_feedback_dataset_1000.csv.csv")
+    df = pd.read_csv("course_feedback_dataset_1000.csv.csv")
+    # Categorical subjects let groupby/value_counts/isin work on integer codes
+    if "Subject" in df.columns:
+        df["Subject"] = df["Subject"].astype("category")
+    # Arrow-backed comments keep string ops in Arrow compute kernels
+    if "Comment" in df.columns:
+        df["Comment"] = df["Comment"].astype(pd.ArrowDtype(pa.string()))
+    return df
+
+# Filter the dataset for a given filter state; the key is a plain tuple of
+# widget values so Streamlit never has to hash the DataFrame itself
+@st.cache_data(max_entries=LARGE_CACHE_ENTRIES)
+def filter_data(filter_key):
+    subject_filter, rating_range, student_id_range = filter_key
+    df = load_data()
+    # Combine all predicates into one boolean mask and slice once
+    mask = np.ones(len(df), dtype=bool)
+    if subject_filter:
+        mask &= df["Subject"].isin(subject_filter).to_numpy()
+    if rating_range is not None:
+        r = df["Rating"].to_numpy()
+        mask &= (r >= rating_range[0]) & (r <= rating_range[1])
+    if student_id_range is not None:
+        ids = df["Student_ID"].to_numpy()
+        mask &= (ids >= student_id_range[0]) & (ids <= student_id_range[1])
+    return df.loc[mask]
+
+# Aggregations shared by the charts, cached per filter state
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def subject_counts_for(filter_key):
+    counts = filter_data(filter_key)["Subject"].value_counts()
+    return counts[counts > 0]
+
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def subject_avg_for(filter_key):
+    return filter_data(filter_key).groupby("Subject", observed=True, sort=False)["Rating"].agg(['mean', 'count']).sort_values('mean')
+
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def student_avg_for(filter_key):
+    return filter_data(filter_key).groupby("Student_ID", sort=False)["Rating"].mean().nlargest(20)
+
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def subject_rating_counts_for(filter_key):
+    return filter_data(filter_key).groupby(["Subject", "Rating"], observed=True).size().reset_index(name='Count')
+
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def rating_subject_for(filter_key):
+    counts = (filter_data(filter_key)
+              .groupby(["Subject", "Rating"], observed=True, sort=False).size()
+              .unstack(fill_value=0)
+              .sort_index().sort_index(axis=1))
+    return counts.div(counts.sum(axis=1), axis=0).mul(100)
+
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def rating_histogram_for(filter_key):
+    counts, edges = np.histogram(filter_data(filter_key)["Rating"].to_numpy(), bins=RATING_BINS)
+    return (edges[:-1] + edges[1:]) / 2, counts
+
+@st.cache_data(max_entries=SMALL_CACHE_ENTRIES)
+def rating_box_stats_for(filter_key):
+    return (filter_data(filter_key)
+            .groupby("Subject", observed=True)["Rating"]
+            .describe(percentiles=[.25, .5, .75]))
+
+# CSV export of the filtered data, cached per filter state
+@st.cache_data(max_entries=LARGE_CACHE_ENTRIES)
+def csv_bytes_for(filter_key):
+    return filter_data(filter_key).to_csv(index=False).encode("utf-8")
+
+# Word cloud image of the non-blank comments, or None if there are none
+@st.cache_data(show_spinner=False, max_entries=LARGE_CACHE_ENTRIES)
+def wordcloud_for(filter_key):
+    comments = filter_data(filter_key)["Comment"].dropna()
+    comments = comments[comments.str.strip() != ""]
+    if comments.empty:
+        return None
+    wc = WordCloud(width=1200, height=500, background_color='white', colormap='viridis').generate(comments.str.cat(sep=" "))
+    return wc.to_array()
+
+# Sidebar widget options and bounds, taken from the unfiltered dataset
+@st.cache_data
+def widget_bounds():
+    df = load_data()
+    bounds = {}
+    if "Subject" in df.columns:
+        bounds["subjects"] = df["Subject"].cat.categories.tolist()
+    if "Rating" in df.columns:
+        bounds["rating"] = (float(df["Rating"].min()), float(df["Rating"].max()))
+    if "Student_ID" in df.columns:
+        bounds["student"] = (int(df["Student_ID"].min()), int(df["Student_ID"].max()))
+    return bounds
+
+# Streamlit sizes the chart from fig.layout.height, so it must be set on the figure
+def show_chart(fig, **kwargs):
+    fig.layout.height = CHART_HEIGHT
+    st.plotly_chart(fig, use_container_width=True, **kwargs)
 
 original_data = load_data()
-data = original_data.copy()
-
-# Store original for reset
-if 'original_data' not in st.session_state:
-    st.session_state.original_data = original_data.copy()
+bounds = widget_bounds()
 
 # ============================================
 # ADVANCED SIDEBAR FILTERS
@@ -46,41 +157,51 @@ if 'original_data' not in st.session_state:
 st.sidebar.title("🔍 Advanced Filters")
 st.sidebar.markdown("---")
 
+subject_filter = []
+rating_range = None
+student_id_range = None
+
 # Filter 1: Subject Selection
-if "Subject" in data.columns:
+if "Subject" in original_data.columns:
     subject_filter = st.sidebar.multiselect(
         "📚 Select Subject(s)",
-        sorted(data["Subject"].unique()),
-        default=list(data["Subject"].unique())
+        bounds["subjects"],
+        default=bounds["subjects"]
     )
-    if subject_filter:
-        data = data[data["Subject"].isin(subject_filter)]
 
 # Filter 2: Rating Range
-if "Rating" in data.columns:
+if "Rating" in original_data.columns:
     rating_range = st.sidebar.slider(
         "⭐ Rating Range",
-        float(data["Rating"].min()),
-        float(data["Rating"].max()),
-        (float(data["Rating"].min()), float(data["Rating"].max())),
+        bounds["rating"][0],
+        bounds["rating"][1],
+        bounds["rating"],
         step=0.5
     )
-    data = data[(data["Rating"] >= rating_range[0]) & (data["Rating"] <= rating_range[1])]
 
 # Filter 3: Student ID Range (optional)
-if "Student_ID" in data.columns:
+if "Student_ID" in original_data.columns:
     student_id_range = st.sidebar.slider(
         "👤 Student ID Range",
-        int(data["Student_ID"].min()),
-        int(data["Student_ID"].max()),
-        (int(data["Student_ID"].min()), int(data["Student_ID"].max()))
+        bounds["student"][0],
+        bounds["student"][1],
+        bounds["student"]
     )
-    data = data[(data["Student_ID"] >= student_id_range[0]) & (data["Student_ID"] <= student_id_range[1])]
+
+# Computed once per run and used as the cache key for all derived work;
+# subjects are sorted so selection order does not split the cache
+filter_key = (tuple(sorted(subject_filter)), rating_range, student_id_range)
+data = filter_data(filter_key)
 
 st.sidebar.markdown("---")
 if st.sidebar.button("🔄 Reset All Filters"):
     st.rerun()
 
+# Nothing to aggregate or plot for an empty selection
+if data.empty:
+    st.warning("No data matches current filters.")
+    st.stop()
+
 # ============================================
 # KEY METRICS
 # ============================================
@@ -96,7 +217,7 @@ if "Subject" in data.columns:
     col3.metric("📚 Unique Subjects", data["Subject"].nunique())
 if "Student_ID" in data.columns:
     col4.metric("👤 Total Students", data["Student_ID"].nunique())
-col5.metric("💬 Total Comments", len(data[data["Comment"].notna()]))
+col5.metric("💬 Total Comments", int(data["Comment"].notna().sum()))
 
 st.markdown("---")
 
@@ -105,29 +226,32 @@ st.markdown("---")
 # ============================================
 st.subheader("📈 Main Analytics")
 
+# Shared by several charts below
+subject_counts = subject_counts_for(filter_key)
+subject_avg = subject_avg_for(filter_key)
+
 col1, col2 = st.columns(2)
 
 # Chart 1: Rating Distribution (Histogram)
 with col1:
     if "Rating" in data.columns:
         st.markdown("### ⭐ Rating Distribution")
-        fig = px.histogram(data, x="Rating", nbins=20, 
-                          title="Rating Distribution",
-                          labels={"Rating": "Rating Score"},
-                          color_discrete_sequence=["#1f77b4"])
-        fig.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        # Bin counts are computed here so only one number per bin reaches the browser
+        centers, counts = rating_histogram_for(filter_key)
+        fig = go.Figure(go.Bar(x=centers, y=counts, width=RATING_BINS[1] - RATING_BINS[0],
+                               marker_color="#1f77b4"))
+        fig.update_layout(title="Rating Distribution",
+                          xaxis_title="Rating Score", yaxis_title="count")
+        show_chart(fig)
 
 # Chart 2: Satisfaction Breakdown (Pie Chart)
 with col2:
     if "Subject" in data.columns:
         st.markdown("### 📚 Subject Distribution")
-        subject_counts = data["Subject"].value_counts()
         fig = px.pie(values=subject_counts.values, names=subject_counts.index,
                     title="Feedback Count by Subject",
                     color_discrete_sequence=px.colors.qualitative.Set2)
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig, config=STATIC_CHART_CONFIG)
 
 # ============================================
 # VISUALIZATIONS - ROW 2
@@ -138,27 +262,24 @@ col1, col2 = st.columns(2)
 with col1:
     if "Subject" in data.columns and "Rating" in data.columns:
         st.markdown("### 📚 Subject-wise Average Rating")
-        subject_avg = data.groupby("Subject")["Rating"].agg(['mean', 'count']).sort_values('mean')
         fig = px.bar(x=subject_avg['mean'], y=subject_avg.index,
                     orientation='h',
                     title="Average Rating by Subject",
                     labels={"x": "Average Rating"},
                     color=subject_avg['mean'],
                     color_continuous_scale="Viridis")
-        fig.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
 # Chart 4: Semester Comparison
 with col2:
     if "Student_ID" in data.columns and "Rating" in data.columns:
         st.markdown("### 📊 Rating Distribution Across Students")
         # Group by student and get average rating
-        student_avg = data.groupby("Student_ID")["Rating"].mean().head(20)
+        student_avg = student_avg_for(filter_key)
         fig = px.bar(x=student_avg.index, y=student_avg.values,
                     title="Top 20 Students - Average Rating",
                     labels={"x": "Student ID", "y": "Average Rating"})
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
 # ============================================
 # VISUALIZATIONS - ROW 3
@@ -169,27 +290,26 @@ col1, col2 = st.columns(2)
 with col1:
     if "Subject" in data.columns and "Rating" in data.columns:
         st.markdown("### 📊 Rating Count by Subject")
-        subject_rating_counts = data.groupby(["Subject", "Rating"]).size().reset_index(name='Count')
+        subject_rating_counts = subject_rating_counts_for(filter_key)
         fig = px.scatter(subject_rating_counts, x="Subject", y="Rating", size="Count", color="Rating",
                         title="Rating Distribution Across Subjects",
                         color_continuous_scale="RdYlGn",
-                        size_max=15)
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+                        size_max=15,
+                        render_mode="webgl" if len(subject_rating_counts) > WEBGL_MIN_POINTS else "svg")
+        show_chart(fig)
 
 # Chart 6: Course Distribution
 with col2:
     if "Subject" in data.columns:
         st.markdown("### 📊 Feedback Count by Subject")
-        subject_counts = data["Subject"].value_counts().head(15)
-        fig = px.bar(x=subject_counts.values, y=subject_counts.index,
+        top_subjects = subject_counts.head(15)
+        fig = px.bar(x=top_subjects.values, y=top_subjects.index,
                     orientation='h',
                     title="Subjects by Feedback Count",
                     labels={"x": "Feedback Count"},
-                    color=subject_counts.values,
+                    color=top_subjects.values,
                     color_continuous_scale="Blues")
-        fig.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig, config=STATIC_CHART_CONFIG)
 
 # ============================================
 # VISUALIZATIONS - ROW 4
@@ -200,23 +320,29 @@ col1, col2 = st.columns(2)
 with col1:
     if "Subject" in data.columns and "Rating" in data.columns:
         st.markdown("### 📈 Rating Distribution by Subject")
-        rating_subject = pd.crosstab(data["Subject"], data["Rating"], normalize='index') * 100
+        rating_subject = rating_subject_for(filter_key)
         fig = px.bar(rating_subject, barmode='stack',
                     title="Rating Distribution by Subject",
                     labels={"value": "Percentage", "index": "Subject"})
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig, config=STATIC_CHART_CONFIG)
 
 # Chart 8: Box Plot - Rating by Satisfaction
 with col2:
     if "Subject" in data.columns and "Rating" in data.columns:
         st.markdown("### 📦 Rating Distribution by Subject")
-        fig = px.box(data, x="Subject", y="Rating",
-                    color="Subject",
-                    title="Rating Range by Subject",
-                    color_discrete_sequence=px.colors.qualitative.Set2)
-        fig.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        # Quartiles are computed here so only five numbers per subject reach the browser
+        stats = rating_box_stats_for(filter_key)
+        colors = px.colors.qualitative.Set2
+        fig = go.Figure([
+            go.Box(x=[subject], q1=[row["25%"]], median=[row["50%"]], q3=[row["75%"]],
+                   lowerfence=[row["min"]], upperfence=[row["max"]],
+                   name=str(subject), marker_color=colors[i % len(colors)])
+            for i, (subject, row) in enumerate(stats.iterrows())
+        ])
+        fig.update_layout(title="Rating Range by Subject",
+                          xaxis_title="Subject", yaxis_title="Rating",
+                          showlegend=False)
+        show_chart(fig)
 
 # ============================================
 # WORD CLOUD
@@ -225,13 +351,9 @@ st.markdown("---")
 st.subheader("☁️ Comment Analysis")
 
 if "Comment" in data.columns:
-    comments_text = " ".join(str(c) for c in data["Comment"] if pd.notna(c) and str(c).strip())
-    if comments_text:
-        fig, ax = plt.subplots(figsize=(12, 5))
-        wc = WordCloud(width=1200, height=500, background_color='white', colormap='viridis').generate(comments_text)
-        ax.imshow(wc, interpolation='bilinear')
-        ax.axis('off')
-        st.pyplot(fig)
+    wordcloud = wordcloud_for(filter_key)
+    if wordcloud is not None:
+        st.image(wordcloud, use_container_width=True)
 
 # ============================================
 # DETAILED DATA VIEW
@@ -239,12 +361,20 @@ if "Comment" in data.columns:
 st.markdown("---")
 st.subheader("📄 Detailed Dataset")
 
-col1, col2 = st.columns([3, 1])
-with col1:
-    st.write(f"**Showing {len(data)} records** (out of {len(original_data)} total)")
-with col2:
-    if st.button("📥 Download Filtered Data (CSV)"):
-        csv = data.to_csv(index=False)
-        st.download_button("Click to download", csv, "feedback_data.csv", "text/csv")
+# The row slider and download button only rerun this fragment
+@st.fragment
+def render_dataset(data, filter_key):
+    n_rows = min(len(data), PREVIEW_ROWS)
+    if len(data) > PREVIEW_ROWS:
+        n_rows = st.slider("Rows to display", PREVIEW_ROWS, len(data), PREVIEW_ROWS, step=PREVIEW_ROWS)
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.write(f"**Showing {n_rows} of {len(data)} records** (out of {len(original_data)} total)")
+    with col2:
+        st.download_button("📥 Download Filtered Data (CSV)", csv_bytes_for(filter_key),
+                           "feedback_data.csv", "text/csv")
+
+    st.dataframe(data.head(n_rows), use_container_width=True, height=400)
 
-st.dataframe(data, use_container_width=True, height=400)
\ No newline at end of file
+render_dataset(data, filter_key)
\ No newline at end of file